@@ -5,10 +5,11 @@ from datetime import datetime
 from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, send_file, session
 from flask_login import LoginManager, login_user, logout_user, login_required, current_user
 from werkzeug.utils import secure_filename
-from models.embedder import get_embedding, get_similarity_score
+from models.embedder import get_embedding
 from extractor.pdf_parser import extract_chunks_from_pdf
 from extractor.section_grouper import group_chunks_into_sections
 from processor.summarizer import summarize_with_ollama, build_prompt
+from processor.ranker import rank_sections
 from utils.json_output import build_output_json
 from database import db, User, Document, AnalysisResult
 import pyttsx3
@@ -306,13 +307,8 @@ def process_documents(documents, persona, job_task, user_id):
     if not sections:
         raise Exception("No sections could be identified in the documents")
     
-    # Score sections by relevance
-    for section in sections:
-        section_embedding = get_embedding(section["title"] + " " + section["content"])
-        section["score"] = get_similarity_score(query_embedding, section_embedding)
-    
-    # Get top 5 most relevant sections
-    ranked = sorted(sections, key=lambda x: x["score"], reverse=True)[:5]
+    # Score sections by relevance and pick 5 distinct, diverse ones
+    ranked = rank_sections(sections, query_embedding, top_k=5)
     
     # Generate summaries for top sections
     for sec in ranked:
@@ -1,9 +1,10 @@
 import os
 import json
-from models.embedder import get_embedding, get_similarity_score
+from models.embedder import get_embedding
 from extractor.pdf_parser import extract_chunks_from_pdf
 from extractor.section_grouper import group_chunks_into_sections
 from processor.summarizer import summarize_with_ollama, build_prompt
+from processor.ranker import rank_sections
 from utils.json_output import build_output_json, save_json
 import warnings
 warnings.filterwarnings("ignore", category=FutureWarning)
@@ -34,12 +35,8 @@ def run_pipeline_from_json(input_path):
 
     sections = group_chunks_into_sections(all_chunks)
 
-    for section in sections:
-        section_embedding = get_embedding(section["title"] + " " + section["content"])
-        section["score"] = get_similarity_score(query_embedding, section_embedding)
-
-    # Top 5 most relevant sections
-    ranked = sorted(sections, key=lambda x: x["score"], reverse=True)[:5]
+    # Top 5 relevant sections, with near-duplicates collapsed
+    ranked = rank_sections(sections, query_embedding, top_k=5)
 
     # Generate summary for each
     for sec in ranked:
@@ -10,3 +10,17 @@ def get_embedding(text):
 
 def get_similarity_score(query_embedding, section_embedding):
     return float(cosine_similarity([query_embedding], [section_embedding])[0][0])
+
+def get_embeddings(texts, batch_size=64):
+    """
+    Encodes a list of texts in batches and returns an L2-normalised
+    (n, dim) matrix, so cosine similarity reduces to a dot product.
+    """
+    if not texts:
+        return np.empty((0, model.get_sentence_embedding_dimension()), dtype=np.float32)
+    return model.encode(
+        texts,
+        batch_size=batch_size,
+        convert_to_numpy=True,
+        normalize_embeddings=True
+    )
@@ -0,0 +1,48 @@
+import numpy as np
+from models.embedder import get_embeddings
+
+
+def section_text(section):
+    return section["title"] + " " + section["content"]
+
+
+def rank_sections(sections, query_embedding, top_k=5, duplicate_threshold=0.92, diversity=0.3):
+    """
+    Picks the top_k sections for summarization using Maximal Marginal Relevance.
+    Sections whose embedding is within duplicate_threshold cosine similarity of an
+    already selected section are collapsed (dropped) so repeated boilerplate across
+    documents is only summarized once. diversity trades relevance (0.0) for novelty (1.0).
+    Every section gets its relevance stored in section["score"].
+    """
+    if not sections:
+        return []
+
+    embeddings = get_embeddings([section_text(s) for s in sections])
+    query = np.asarray(query_embedding, dtype=np.float32)
+    query = query / (np.linalg.norm(query) or 1.0)
+
+    relevance = embeddings @ query
+    for section, score in zip(sections, relevance):
+        section["score"] = float(score)
+
+    # Highest similarity of every candidate to anything selected so far
+    max_similarity = np.full(len(sections), -np.inf, dtype=np.float32)
+    available = np.ones(len(sections), dtype=bool)
+    selected = []
+
+    while len(selected) < top_k and available.any():
+        if selected:
+            mmr = (1 - diversity) * relevance - diversity * max_similarity
+        else:
+            mmr = relevance.copy()
+        mmr[~available] = -np.inf
+        best = int(np.argmax(mmr))
+        selected.append(best)
+        available[best] = False
+
+        similarity = embeddings @ embeddings[best]
+        np.maximum(max_similarity, similarity, out=max_similarity)
+        # Collapse near-duplicates of the section we just picked
+        available &= max_similarity < duplicate_threshold
+
+    return [sections[i] for i in selected]